@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Literal, TypedDict, get_args, Self, NoReturn, TypeGuard
-import math
 import csv
 from currencies import Currency  # type: ignore
 
@@ -12,37 +13,46 @@ from .typedefs import (
     IncomeCategory,
 )
 from .errors import BudgetFileParsingError
-from .calendar_time import CalendarTime, CalendarTimeUnits
+from .calendar_time import CalendarTime, CalendarTimeUnits, _UNITS_SET
 
 
-def _one_month_factory() -> CalendarTime:
-    return CalendarTime(1, "months")
+# Budgets tend to reuse a handful of recurrences, so the (frozen) CalendarTime objects are
+# interned rather than building an identical one for every planned item.
+@lru_cache(maxsize=None)
+def _get_calendar_time(value: int, unit: CalendarTimeUnits) -> CalendarTime:
+    return CalendarTime(value, unit)
 
 
-@dataclass(kw_only=True)
-class _PlannedItem:
+_ONE_MONTH = _get_calendar_time(1, "months")
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class _PlannedItem(ABC):
     name: str
     amount: float
-    recurrence: CalendarTime | None = field(default_factory=_one_month_factory)
+    recurrence: CalendarTime | None = _ONE_MONTH
     currency: Currency = Currency("USD")
+    # derived from amount & recurrence once at construction; see get_normalized_monthly_amount()
+    _normalized_monthly: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.amount < 0.0:
             raise ValueError("Amount must be non-negative!")
 
-    def get_normalized_monthly_amount(self) -> float:
         if self.recurrence is None:
-            return self.amount
+            normalized = self.amount
         else:
-            if self.recurrence.unit == "years":
-                return self.amount / (12 * self.recurrence.value)
-            elif self.recurrence.unit == "months":
-                return self.amount / (self.recurrence.value)
-            else:
-                raise TypeError(
-                    "A CalendarTime's unit attribute was set to an unsupported value! "
-                    "Please only use 'months' or 'years' for this field."
-                )
+            normalized = self.amount / (
+                self.recurrence._month_factor * self.recurrence.value
+            )
+        # frozen dataclass, so the derived field must bypass __setattr__
+        object.__setattr__(self, "_normalized_monthly", normalized)
+
+    def get_normalized_monthly_amount(self) -> float:
+        return self._normalized_monthly
+
+    @abstractmethod
+    def to_budget_row(self) -> _BudgetRow: ...
 
 
 _IncomeOrExpense = Literal["income", "expense"]
@@ -62,6 +72,25 @@ class _BudgetRow(TypedDict):
     post_tax: _BoolString | Literal[""]
 
 
+# the allowed values of each Literal, resolved once at import so that row validation is a
+# plain hashed membership test instead of re-introspecting the Literal for every row.
+_REQUIRED_KEYS = tuple(_BudgetRow.__annotations__.keys())
+_INCOME_OR_EXPENSE_SET = frozenset(get_args(_IncomeOrExpense))
+_EXPENSE_CATEGORY_SET = frozenset(get_args(ExpenseCategory))
+_EXPENSE_PRIORITY_SET = frozenset(get_args(ExpensePriority))
+_INCOME_CATEGORY_SET = frozenset(get_args(IncomeCategory))
+_BOOL_STRING_SET = frozenset(get_args(_BoolString))
+
+# every column blank; to_budget_row() copies this and only fills in the non-blank columns
+_EMPTY_ROW_TEMPLATE: _BudgetRow = dict.fromkeys(_REQUIRED_KEYS, "")  # type: ignore
+
+# fixed ordering of the expense categories so that per-category totals can live in a flat list
+_EXPENSE_CATEGORIES: tuple[ExpenseCategory, ...] = get_args(ExpenseCategory)
+_EXPENSE_CATEGORY_INDEX: dict[ExpenseCategory, int] = {
+    category: i for i, category in enumerate(_EXPENSE_CATEGORIES)
+}
+
+
 def _validate_budget_row(row: dict) -> TypeGuard[_BudgetRow]:
     """Run-time check that the input row (dict) is actually valid for use as a _BudgetRow."""
 
@@ -70,13 +99,13 @@ def _validate_budget_row(row: dict) -> TypeGuard[_BudgetRow]:
             f"Unexpected value for column '{column_name}': '{row[column_name]}'!"  # type: ignore
         )
 
-    for k in _BudgetRow.__annotations__.keys():
+    for k in _REQUIRED_KEYS:
         if k not in row:
             raise BudgetFileParsingError(
                 f"The required column header, {k}, was not present in the provided CSV file!"
             )
 
-    if row["income_or_expense"] not in get_args(_IncomeOrExpense):
+    if row["income_or_expense"] not in _INCOME_OR_EXPENSE_SET:
         _raise_unexpected_value(row, "income_or_expense")
 
     if (row["recurrence_unit"] == "" and row["recurrence_value"] != "") or (
@@ -87,29 +116,27 @@ def _validate_budget_row(row: dict) -> TypeGuard[_BudgetRow]:
             "columns must be blank or neither must be!"
         )
 
-    if row["recurrence_unit"] != "" and row["recurrence_unit"] not in get_args(
-        CalendarTimeUnits
-    ):
+    if row["recurrence_unit"] != "" and row["recurrence_unit"] not in _UNITS_SET:
         _raise_unexpected_value(row, "recurrence_unit")
 
     if row["income_or_expense"] == "expense":
-        if row["category"] not in get_args(ExpenseCategory):
+        if row["category"] not in _EXPENSE_CATEGORY_SET:
             _raise_unexpected_value(row, "category")
-        if row["priority"] not in get_args(ExpensePriority):
+        if row["priority"] not in _EXPENSE_PRIORITY_SET:
             _raise_unexpected_value(row, "priority")
 
     if row["income_or_expense"] == "income":
-        if row["category"] not in get_args(IncomeCategory):
+        if row["category"] not in _INCOME_CATEGORY_SET:
             _raise_unexpected_value(row, "category")
 
         row["post_tax"] = str(row["post_tax"]).lower()
-        if row["post_tax"] not in get_args(_BoolString):
+        if row["post_tax"] not in _BOOL_STRING_SET:
             _raise_unexpected_value(row, "post_tax")
 
     return True
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class PlannedExpense(_PlannedItem):
     """Always used to express planned expenses (or savings contributions), not income."""
 
@@ -119,26 +146,20 @@ class PlannedExpense(_PlannedItem):
     savings_goal: str | None = None
 
     def to_budget_row(self) -> _BudgetRow:
-        currency = (
-            "" if self.currency.money_currency is None else self.currency.money_currency
-        )
-        recurrence_value = "" if self.recurrence is None else str(self.recurrence.value)
-        recurrence_unit: CalendarTimeUnits | Literal[""] = (
-            "" if self.recurrence is None else self.recurrence.unit
-        )
-        savings_goal = "" if self.savings_goal is None else self.savings_goal
-        return _BudgetRow(
-            income_or_expense="expense",
-            name=self.name,
-            category=self.category,
-            amount=f"{self.amount:.2f}",
-            currency=currency,
-            recurrence_value=recurrence_value,
-            recurrence_unit=recurrence_unit,
-            priority=self.priority,
-            savings_goal=savings_goal,
-            post_tax="",
-        )
+        row = _EMPTY_ROW_TEMPLATE.copy()
+        row["income_or_expense"] = "expense"
+        row["name"] = self.name
+        row["category"] = self.category
+        row["amount"] = format(self.amount, ".2f")
+        if self.currency.money_currency is not None:
+            row["currency"] = self.currency.money_currency
+        if self.recurrence is not None:
+            row["recurrence_value"] = str(self.recurrence.value)
+            row["recurrence_unit"] = self.recurrence.unit
+        row["priority"] = self.priority
+        if self.savings_goal is not None:
+            row["savings_goal"] = self.savings_goal
+        return row
 
     @classmethod
     def from_budget_row(cls, row: dict) -> Self:
@@ -146,7 +167,7 @@ class PlannedExpense(_PlannedItem):
             if row["recurrence_unit"] == "":
                 recurrence: None | CalendarTime = None
             else:
-                recurrence = CalendarTime(
+                recurrence = _get_calendar_time(
                     int(row["recurrence_value"]),
                     row["recurrence_unit"],  # type: ignore
                 )
@@ -165,31 +186,24 @@ class PlannedExpense(_PlannedItem):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class PlannedIncome(_PlannedItem):
     category: IncomeCategory
     post_tax: bool
 
     def to_budget_row(self) -> _BudgetRow:
-        currency = (
-            "" if self.currency.money_currency is None else self.currency.money_currency
-        )
-        recurrence_value = "" if self.recurrence is None else str(self.recurrence.value)
-        recurrence_unit: CalendarTimeUnits | Literal[""] = (
-            "" if self.recurrence is None else self.recurrence.unit
-        )
-        return _BudgetRow(
-            income_or_expense="income",
-            name=self.name,
-            category=self.category,
-            amount=f"{self.amount:.2f}",
-            currency=currency,
-            recurrence_value=recurrence_value,
-            recurrence_unit=recurrence_unit,
-            priority="",
-            savings_goal="",
-            post_tax="true" if self.post_tax else "false",
-        )
+        row = _EMPTY_ROW_TEMPLATE.copy()
+        row["income_or_expense"] = "income"
+        row["name"] = self.name
+        row["category"] = self.category
+        row["amount"] = format(self.amount, ".2f")
+        if self.currency.money_currency is not None:
+            row["currency"] = self.currency.money_currency
+        if self.recurrence is not None:
+            row["recurrence_value"] = str(self.recurrence.value)
+            row["recurrence_unit"] = self.recurrence.unit
+        row["post_tax"] = "true" if self.post_tax else "false"
+        return row
 
     @classmethod
     def from_budget_row(cls, row: dict) -> Self:
@@ -197,7 +211,7 @@ class PlannedIncome(_PlannedItem):
             if row["recurrence_unit"] == "":
                 recurrence: None | CalendarTime = None
             else:
-                recurrence = CalendarTime(
+                recurrence = _get_calendar_time(
                     int(row["recurrence_value"]),
                     row["recurrence_unit"],  # type: ignore
                 )
@@ -225,6 +239,20 @@ class PlannedIncome(_PlannedItem):
 
 SavingsGoal = str
 
+# budget CSVs are read and written through a large buffer so that even big files only take a
+# handful of read/write syscalls.
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+@dataclass(slots=True, frozen=True)
+class _BudgetAggregates:
+    """Everything a Budget derives from its entries, computed together in one pass."""
+
+    gross: float
+    total_expense: float
+    # monthly expense totals, indexed in the same order as _EXPENSE_CATEGORIES
+    alloc: tuple[float, ...]
+
 
 class Budget:
     """A summary of all PLANNED expenses and income. To clarify, the budget is the PLAN not the
@@ -232,23 +260,72 @@ class Budget:
 
     def __init__(self, *entries: PlannedExpense | PlannedIncome) -> None:
         self.balance: float = 0.0
-        self.entries: list[PlannedExpense | PlannedIncome] = list(entries)
+        self._entries: list[PlannedExpense | PlannedIncome] = []
         self.saving_goals: dict[str, SavingsGoal] = {}
-        self.allocations: dict[ExpenseCategory, float] = {
-            k: 0.0 for k in get_args(ExpenseCategory)
-        }
+
+        # everything derived from the entries is memoized until they change; see _aggregates()
+        self._dirty: bool = True
+        self._cached_aggregates = _BudgetAggregates(
+            gross=0.0, total_expense=0.0, alloc=(0.0,) * len(_EXPENSE_CATEGORIES)
+        )
 
         for entry in entries:
-            if not (
-                isinstance(entry, PlannedExpense) or isinstance(entry, PlannedIncome)
-            ):
-                raise TypeError(
-                    "Entries must be either a PlannedExpense or PlannedIncome object!"
-                )
-            if isinstance(entry, PlannedExpense):
-                self.allocations[entry.category] += (
-                    entry.get_normalized_monthly_amount()
-                )
+            self.add_entry(entry)
+
+    @property
+    def entries(self) -> tuple[PlannedExpense | PlannedIncome, ...]:
+        """A read-only snapshot of the budget's entries. Use add_entry() and remove_entry() to
+        change them so that the memoized aggregates are recomputed."""
+        return tuple(self._entries)
+
+    def add_entry(self, entry: PlannedExpense | PlannedIncome) -> None:
+        """Registers a new entry with the budget."""
+        # exact type checks (the planned item classes are not meant to be subclassed) keep this
+        # consistent with the `type(entry) is PlannedExpense` dispatch in _aggregates()
+        if type(entry) not in (PlannedExpense, PlannedIncome):
+            raise TypeError(
+                "Entries must be either a PlannedExpense or PlannedIncome object!"
+            )
+        self._entries.append(entry)
+        self._dirty = True
+
+    def remove_entry(self, entry: PlannedExpense | PlannedIncome) -> None:
+        """Removes the first entry equal to the given one from the budget."""
+        try:
+            self._entries.remove(entry)
+        except ValueError:
+            raise ValueError("The given entry is not part of this Budget!") from None
+        self._dirty = True
+
+    def _aggregates(self) -> _BudgetAggregates:
+        """Returns the gross, total expense and per-category allocations. They are recomputed
+        together, in a single pass over the entries, only when the entries have changed.
+        """
+        if not self._dirty:
+            return self._cached_aggregates
+
+        gross = 0.0
+        total_expense = 0.0
+        alloc = [0.0] * len(_EXPENSE_CATEGORIES)
+        for entry in self._entries:
+            normalized = entry.get_normalized_monthly_amount()
+            if type(entry) is PlannedExpense:
+                gross -= normalized
+                total_expense += entry.amount
+                alloc[_EXPENSE_CATEGORY_INDEX[entry.category]] += normalized
+            else:
+                gross += normalized
+
+        self._cached_aggregates = _BudgetAggregates(
+            gross=gross, total_expense=total_expense, alloc=tuple(alloc)
+        )
+        self._dirty = False
+        return self._cached_aggregates
+
+    @property
+    def allocations(self) -> dict[ExpenseCategory, float]:
+        """The normalized monthly expense total of every expense category."""
+        return dict(zip(_EXPENSE_CATEGORIES, self._aggregates().alloc))
 
     def get_monthly_gross(self) -> float:
         """Returns the sum of all income minus the sum of all expenses on a monthly basis. All
@@ -256,61 +333,66 @@ class Budget:
         by the number of months they span.
 
         TODO: implement a strategy for dealing with daily & weekly items."""
-        gross = 0.0
-        for entry in self.entries:
-            sign = -1.0 if isinstance(entry, PlannedExpense) else 1.0
-            gross += sign * entry.get_normalized_monthly_amount()
-
-        return gross
+        return self._aggregates().gross
 
     def get_total_monthly_expense(self) -> float:
-        total_expense: float = 0.0
-        for entry in self.entries:
-            if isinstance(entry, PlannedExpense):
-                total_expense += entry.amount
-
-        return total_expense
+        return self._aggregates().total_expense
 
     def get_monthly_expenses_as_fraction(self) -> dict[ExpenseCategory, float]:
-        total = self.get_total_monthly_expense()
-        if math.isclose(total, 0.0):
+        aggregates = self._aggregates()
+        total = aggregates.total_expense
+        # amounts are guaranteed non-negative, so this is the same as math.isclose(total, 0.0)
+        if total <= 0.0:
             raise RuntimeError(
                 "Attempted to call 'get_monthly_expenses_as_fraction()' "
                 "without any non-zero monthly expenses registered to the Budget yet!"
             )
-        return {k: (v / total) for k, v in self.allocations.items()}
+        return dict(zip(_EXPENSE_CATEGORIES, [v / total for v in aggregates.alloc]))
 
     def export_file(self, path: str) -> None:
         if not (path.endswith(".csv") or path.endswith(".CSV")):
             raise ValueError("The provided path must point to a file ending in '.csv'!")
-        with open(path, "wt", newline="", encoding="utf-8") as outfile:
-            writer = csv.DictWriter(
-                outfile, fieldnames=_BudgetRow.__annotations__.keys()
-            )
+        with open(
+            path, "wt", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+        ) as outfile:
+            writer = csv.DictWriter(outfile, fieldnames=_REQUIRED_KEYS)
 
             # write the CSV headers
             writer.writeheader()
 
-            for entry in self.entries:
-                writer.writerow(entry.to_budget_row())
+            writer.writerows(entry.to_budget_row() for entry in self._entries)
 
     @classmethod
     def from_file(cls, path: str) -> Self:
         if not (path.endswith(".csv") or path.endswith(".CSV")):
             raise ValueError("The provided path must point to a file ending in '.csv'!")
 
+        row_parsers = {
+            "expense": PlannedExpense.from_budget_row,
+            "income": PlannedIncome.from_budget_row,
+        }
         entries: list[PlannedExpense | PlannedIncome] = []
-        with open(path, "rt", newline="", encoding="utf-8") as infile:
+        with open(
+            path, "rt", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+        ) as infile:
             csv_reader = csv.DictReader(infile)
+
+            # check the header once up front instead of discovering a missing column row by row
+            if csv_reader.fieldnames is not None:
+                for k in _REQUIRED_KEYS:
+                    if k not in csv_reader.fieldnames:
+                        raise BudgetFileParsingError(
+                            f"The required column header, {k}, was not present in the provided "
+                            "CSV file!"
+                        )
+
             for row in csv_reader:
-                if row["income_or_expense"] == "expense":
-                    entries.append(PlannedExpense.from_budget_row(row))
-                elif row["income_or_expense"] == "income":
-                    entries.append(PlannedIncome.from_budget_row(row))
-                else:
+                row_parser = row_parsers.get(row["income_or_expense"])
+                if row_parser is None:
                     raise BudgetFileParsingError(
                         "Unexpected value for column 'income_or_expense': "
                         f"'{row['income_or_expense']}'!"
                     )
+                entries.append(row_parser(row))
 
         return cls(*entries)
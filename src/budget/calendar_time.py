@@ -1,16 +1,32 @@
-from typing import Literal
-from dataclasses import dataclass
+from typing import Literal, get_args
+from dataclasses import dataclass, field
+from enum import IntEnum
 
 CalendarTimeUnits = Literal[
     "months", "years"
 ]  # Literal["days", "weeks", "months", "years"]
+_UNITS_SET = frozenset(get_args(CalendarTimeUnits))
 
 
-@dataclass
+class _UnitMonths(IntEnum):
+    """The number of months spanned by one of each supported CalendarTimeUnits."""
+
+    MONTHS = 1
+    YEARS = 12
+
+
+@dataclass(slots=True, frozen=True)
 class CalendarTime:
     value: int
     unit: CalendarTimeUnits
+    _month_factor: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.value <= 0:
             raise ValueError("Calendar time must be at least one!")
+        if self.unit not in _UNITS_SET:
+            raise TypeError(
+                "A CalendarTime's unit attribute was set to an unsupported value! "
+                "Please only use 'months' or 'years' for this field."
+            )
+        object.__setattr__(self, "_month_factor", _UnitMonths[self.unit.upper()].value)
@@ -1,9 +1,14 @@
 import math
 from datetime import datetime, timedelta
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, InitVar
+from typing import Any, Iterable, Self
 from phonenumbers import PhoneNumber
 
+_ONE_HUNDRED_YEARS = timedelta(days=365 * 200)
+# I provide one day buffer to fully account for all timezone complexity. ;)
+_TOMORROW_BUFFER = timedelta(days=1)
+
 
 class Party:
     """An entitiy which is capable of participating in a transaction. Could be a financial
@@ -25,20 +30,31 @@ class Transaction:
     amount: float
     date: datetime
     tax: float = 0.0
+    # the moment to validate the date against, defaulting to datetime.now(); lets
+    # bulk_construct() check a whole batch against a single timestamp
+    now: InitVar[datetime | None] = None
 
-    def __post_init__(self) -> None:
+    def __post_init__(self, now: datetime | None) -> None:
         if not math.isfinite(self.amount) or self.amount <= 0.0:
             raise ValueError(
                 "Transaction amount must be a positive, finite, normalized value!"
             )
 
-        one_hundred_years = timedelta(days=365 * 200)
-        if self.date < datetime.now() - one_hundred_years:
+        if now is None:
+            now = datetime.now()
+        if self.date < now - _ONE_HUNDRED_YEARS:
             warnings.warn(
                 f"Warning: the transaction '{self.title}' occurred on a date more than one "
                 "hundred years before today. Please review this transaction for errors."
             )
 
-        if self.date > datetime.now() + timedelta(days=1):
-            # I provide one day buffer to fully account for all timezone complexity. ;)
+        if self.date > now + _TOMORROW_BUFFER:
             raise ValueError("Transactions cannot occur in the future!")
+
+    @classmethod
+    def bulk_construct(cls, rows: Iterable[dict[str, Any]]) -> list[Self]:
+        """Builds one Transaction per row of keyword arguments, validating every date against
+        the same moment rather than looking up the current time for each transaction. A row
+        may still pass its own `now`, which takes precedence."""
+        now = datetime.now()
+        return [cls(**{"now": now, **row}) for row in rows]